@@ -7,10 +7,16 @@ docs [1] and at a canonical exemplar module [2].
 [2]: https://github.com/ai4os-hub/demo-advanced
 """
 
+import copy
 import logging
+import tempfile
+import threading
 
-import toml
-from . import interface as witoil
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+import tomli_w
 
 from . import config, responses, schemas, utils
 
@@ -21,6 +27,35 @@ import os
 logger = logging.getLogger(__name__)
 logger.setLevel(config.LOG_LEVEL)
 
+# Template configuration for the WITOIL simulations
+CONFIG_FILE = "WITOIL_iMagine/config.toml"
+# Prediction options that must not be written to the logs
+SECRET_OPTIONS = ("copernicus_password", "cds_token")
+# Simulations share the model build, run and data download folders, so
+# only one of them runs at a time
+_run_lock = threading.Lock()
+# Parsed configuration files, as {path: (modification time, data)}
+_config_cache = {}
+
+
+def load_config(path=CONFIG_FILE):
+    """Returns a copy of the parsed configuration file. The file is only
+    parsed again when its modification time changes.
+
+    Arguments:
+        path -- Path to the toml configuration file.
+
+    Returns:
+        A dictionary with the configuration, safe to be modified.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _config_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        logger.debug("Parsing configuration file: %s", path)
+        with open(path, "rb") as file:
+            cached = _config_cache[path] = (mtime, tomllib.load(file))
+    return copy.deepcopy(cached[1])
+
 
 def get_metadata():
     """Returns a dictionary containing metadata information about the module.
@@ -68,10 +103,20 @@ def predict(**options):
         The predicted model values png, pdf or mp4 file.
     """
 
-    logger.debug("Predict with args: %s", options)
+    if logger.isEnabledFor(logging.DEBUG):
+        safe_options = {
+            k: "***" if k in SECRET_OPTIONS else v
+            for k, v in options.items()
+        }
+        logger.debug("Predict with args: %s", safe_options)
+    # The simulation modules pull in the whole scientific stack, import
+    # them on first prediction so loading the API and metadata stay fast
+    # pylint: disable=import-outside-toplevel
+    from . import interface as witoil
+
     try:  # Call your AI model predict() method
         # Load config.toml and modify the user inputs
-        tdata = toml.load("WITOIL_iMagine/config.toml")
+        tdata = load_config()
 
         tdata["simulation"]["name"] = options["name"]
         tdata["simulation"]["start_datetime"] = options[
@@ -99,11 +144,18 @@ def predict(**options):
         tdata["plot_options"]["plot_lon"] = options["plot_lon"]
         tdata["plot_options"]["plot_lat"] = options["plot_lat"]
 
-        conf = open("WITOIL_iMagine/config.toml", "w")
-        toml.dump(tdata, conf)
-        conf.close()
-
-        witoil.main_run("WITOIL_iMagine/config.toml")
+        # Write a per-request config (the template file is left untouched),
+        # it holds the credentials so it is removed even if writing fails
+        conf = tempfile.NamedTemporaryFile(
+            "wb", suffix=".toml", delete=False
+        )
+        try:
+            with conf:
+                tomli_w.dump(tdata, conf)
+            with _run_lock:
+                witoil.main_run(conf.name)
+        finally:
+            os.remove(conf.name)
         result = (
             "WITOIL_iMagine/cases/"
             + options["name"]
@@ -1,35 +1,139 @@
 # ------------------------------------------------
 # MEDSLIK-II oil spill fate and transport model
 # ------------------------------------------------
+import contextlib
+import functools
+import json
+import os
+import queue
 import shutil
 import logging
-import importlib.util
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
-from glob import glob as gg
+from pathlib import Path
 
-# Import medslik modules
-from WITOIL_iMagine.src.utils import Utils, Config, read_oilbase
-from WITOIL_iMagine.src.download import *
-from WITOIL_iMagine.src.preprocessing import PreProcessing
-from WITOIL_iMagine.src.postprocessing import PostProcessing
-from WITOIL_iMagine.src.plot import MedslikIIPlot
+import numpy as np
+import pandas as pd
+
+# Import medslik modules, the download, preprocessing, postprocessing and
+# plot modules are heavy and imported by the steps that use them
+from WITOIL_iMagine.src.utils import Utils, Config
+
+# Domains centred inside these bounds download the Mediterranean (local)
+# CMEMS product, (lon_min, lon_max, lat_min, lat_max) as the domains
+MED_BOUNDS = (-17.25, 36, 30.37, 45.7)
 
 # Create a logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-# Create a file handler with overwrite mode ('w')
-file_handler = logging.FileHandler("medslik_run.log", mode="w")
-file_handler.setLevel(logging.DEBUG)
-
-# Create a formatter and set it for the handler
+# Create a formatter for the simulation log file
 formatter = logging.Formatter(
     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
-file_handler.setFormatter(formatter)
 
-# Add the file handler to the logger
-logger.addHandler(file_handler)
+
+@contextlib.contextmanager
+def _run_log(log_directory):
+    """
+    Write the records of the run to `log_directory`/medslik_run.log. The
+    file is written from a listener thread so logging does not block the
+    run, runs are serialized by the caller (see api.predict).
+    """
+    log_queue = queue.Queue(-1)
+    handler = QueueHandler(log_queue)
+    # Create a file handler with overwrite mode ('w')
+    file_handler = logging.FileHandler(
+        os.path.join(log_directory, "medslik_run.log"), mode="w"
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+    listener = QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger.addHandler(handler)
+    try:
+        yield
+    finally:
+        logger.removeHandler(handler)
+        listener.stop()
+        file_handler.close()
+
+
+def _experiment_directory(config):
+    """
+    Folder of the experiment described by `config`.
+    """
+    simulation = config["simulation"]
+    return os.path.join(simulation["experiment_path"], simulation["name"])
+
+
+@functools.lru_cache(maxsize=32)
+def _check_land(lon, lat, coastline_path, mtime):
+    """
+    Cached Utils.check_land, `mtime` only takes part of the cache key.
+    """
+    return Utils.check_land(list(lon), list(lat), coastline_path)
+
+
+def check_land(lon, lat, coastline_path):
+    """
+    Check if the spill points are on land. The coastline is only read
+    again for new coordinates or when the coastline file changes.
+    """
+    mtime = os.stat(coastline_path).st_mtime_ns
+    return _check_land(tuple(lon), tuple(lat), coastline_path, mtime)
+
+
+def _scan_files(directory, suffix=""):
+    """
+    List the files in `directory` whose name ends with `suffix`. Hidden
+    files are skipped and a missing directory is treated as empty.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(suffix)
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _stage(src, dst_dir):
+    """
+    Place `src` into `dst_dir` as a hard link, so no data is copied. Falls
+    back to a copy when linking is not possible (e.g. across filesystems).
+    """
+    target = os.path.join(dst_dir, os.path.basename(src))
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(target)
+    try:
+        os.link(src, target)
+    except OSError:
+        shutil.copy(src, target)
+
+
+def _link_tree(src, dst, exclude=()):
+    """
+    Mirror the `src` tree into `dst` in a single scandir pass, files are
+    placed with _stage. Entries of `src` named in `exclude` are skipped.
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            if entry.name in exclude:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                _link_tree(entry.path, os.path.join(dst, entry.name))
+            else:
+                _stage(entry.path, dst)
 
 
 class MedslikII:
@@ -43,21 +147,17 @@ class MedslikII:
         """
         self.config = config
         # Create experiment directories
-        self.root_directory = os.path.join(
-            self.config["simulation"]["experiment_path"],
-            config["simulation"]["name"],
-        )
-        os.makedirs(self.root_directory, exist_ok=True)
+        self.root_directory = _experiment_directory(config)
         self.out_directory = os.path.join(
             self.root_directory, "out_files"
         )
-        os.makedirs(self.out_directory, exist_ok=True)
         self.out_figures = os.path.join(self.out_directory, "figures")
-        os.makedirs(self.out_figures, exist_ok=True)
         self.xp_directory = os.path.join(
             self.root_directory, "xp_files"
         )
-        os.makedirs(self.xp_directory, exist_ok=True)
+        # Creating the leaves also creates root and out directories
+        Path(self.out_figures).mkdir(parents=True, exist_ok=True)
+        Path(self.xp_directory).mkdir(parents=True, exist_ok=True)
         spill_lat = np.array(self.config["simulation"]["spill_lat"])
         self.n_spill_points = np.shape(spill_lat)[0]
         # Domain of the simulation will be defined under what the user set in config files
@@ -74,8 +174,8 @@ class MedslikII:
         # Domain is based on a delta degrees
         else:
             logger.info(
-                f"Domain defined around simulation point, \
-                using {config['input_files']['delta'][0]} degrees"
+                "Domain defined around simulation point, using %s degrees",
+                config["input_files"]["delta"][0],
             )
             latitude = config["simulation"]["spill_lat"][0]
             longitude = config["simulation"]["spill_lon"][0]
@@ -90,6 +190,12 @@ class MedslikII:
             )
         self.lat_min, self.lat_max = lat_min, lat_max
         self.lon_min, self.lon_max = lon_min, lon_max
+        # Computed once, shared by the download and preprocessing steps
+        self.domain = (lon_min, lon_max, lat_min, lat_max)
+        # Parse the start date once and share it through the config
+        simulation = self.config["simulation"]
+        self.start_ts = pd.Timestamp(simulation["start_datetime"])
+        simulation["start_datetime"] = self.start_ts
         self.initial_checking()
 
     def initial_checking(self):
@@ -103,7 +209,7 @@ class MedslikII:
         coastline_path = self.config["input_files"]["dtm"][
             "coastline_path"
         ]
-        sea = Utils.check_land(lon, lat, coastline_path)
+        sea = check_land(lon, lat, coastline_path)
         if sea == 0:
             raise ValueError(
                 "Your coordinates lie within land. Please check your values again"
@@ -118,42 +224,54 @@ class MedslikII:
 
     @staticmethod
     def data_download_medslik(
-        config: dict, domain: list[float], root_directory: str
+        config: dict, domain: tuple, root_directory: str
     ) -> None:
         """
         Download METOCE datasets.
         """
+        from WITOIL_iMagine.src.download import (
+            download_copernicus,
+            get_era5,
+            process_era5,
+            write_cds,
+        )
+
         lon_min, lon_max, lat_min, lat_max = domain
-        copernicus_user = config["download"]["copernicus_user"]
-        copernicus_pass = config["download"]["copernicus_password"]
+        download_options = config["download"]
+        simulation = config["simulation"]
+        copernicus_user = download_options["copernicus_user"]
+        copernicus_pass = download_options["copernicus_password"]
 
-        date = pd.to_datetime(config["simulation"]["start_datetime"])
+        date = simulation["start_datetime"]
+        if not isinstance(date, pd.Timestamp):
+            date = pd.Timestamp(date)
 
-        identifier = (
-            str(date.year)
-            + str(date.month).zfill(2)
-            + str(date.day).zfill(2)
-        )
+        identifier = date.strftime("%Y%m%d")
 
         inidate = date - pd.Timedelta(hours=1)
         enddate = date + pd.Timedelta(
-            hours=config["simulation"]["sim_length"] + 24
+            hours=simulation["sim_length"] + 24
         )
 
+        lat_center = (lat_min + lat_max) * 0.5
+        lon_center = (lon_min + lon_max) * 0.5
+        med_lon_min, med_lon_max, med_lat_min, med_lat_max = MED_BOUNDS
         if (
-            30.37 < np.mean([lat_min, lat_max]) < 45.7
-            and -17.25 < np.mean([lon_min, lon_max]) < 36
+            med_lat_min < lat_center < med_lat_max
+            and med_lon_min < lon_center < med_lon_max
         ):
             down = "local"
         else:
             down = "global"
 
-        if config["download"]["download_curr"]:
-            output_path = "WITOIL_iMagine/data/COPERNICUS/"
+        copernicus_path = "WITOIL_iMagine/data/COPERNICUS/"
+        era5_path = "WITOIL_iMagine/data/ERA5/"
+
+        def download_currents():
             output_name = (
-                output_path
+                copernicus_path
                 + "Copernicus{}_{}_{}_mdk.nc".format(
-                    "{}", identifier, config["simulation"]["name"]
+                    "{}", identifier, simulation["name"]
                 )
             )
 
@@ -168,30 +286,20 @@ class MedslikII:
                 inidate,
                 enddate,
                 down,
-                output_path=output_path,
+                output_path=copernicus_path,
                 output_name=output_name,
                 user=copernicus_user,
                 password=copernicus_pass,
             )
 
-            source_files = gg(f"{output_path}*{identifier}*{config['simulation']['name']}*.nc")
-            destination = os.path.join(root_directory, "oce_files")
-            for file in source_files:
-                shutil.copy(file, destination)
-
-            for file in gg(f"{output_path}*{identifier}*{config['simulation']['name']}*.nc"):
-                os.remove(file)
-
-
-        if config["download"]["download_wind"]:
+        def download_winds():
             # ensuring .cdsapirc is created in the home directory
-            write_cds(config["download"]["cds_token"])
+            write_cds(download_options["cds_token"])
 
-            output_path = "WITOIL_iMagine/data/ERA5/"
             output_name = (
-                output_path
+                era5_path
                 + "era5_winds10_{}_{}_mdk.nc".format(
-                    identifier, config["simulation"]["name"]
+                    identifier, simulation["name"]
                 )
             )
 
@@ -203,36 +311,97 @@ class MedslikII:
                 lat_max,
                 inidate,
                 enddate,
-                output_path=output_path,
+                output_path=era5_path,
                 output_name=output_name,
             )
             process_era5(
-                output_path=output_path, output_name=output_name
+                output_path=era5_path, output_name=output_name
             )
 
-            source_files = gg(f"{output_path}*{identifier}*{config['simulation']['name']}*.nc")
-            destination = os.path.join(root_directory, "met_files")
-            for file in source_files:
-                shutil.copy(file, destination)
+        # Parameters the downloaded files depend on, recorded next to the
+        # experiment folders so a new run with the same ones skips them
+        request = {
+            "domain": [lon_min, lon_max, lat_min, lat_max],
+            "inidate": str(inidate),
+            "enddate": str(enddate),
+        }
 
-            for file in gg(f"{output_path}*{identifier}*{config['simulation']['name']}*.nc"):
-                os.remove(file)
+        def manifest(folder):
+            return os.path.join(root_directory, f".{folder}.json")
+
+        def is_downloaded(folder):
+            files = _scan_files(os.path.join(root_directory, folder), ".nc")
+            if not any(os.path.getsize(file) > 0 for file in files):
+                return False
+            try:
+                with open(manifest(folder)) as file:
+                    return json.load(file) == request
+            except (OSError, ValueError):
+                return False
+
+        # (name, download function, download folder, experiment folder)
+        downloads = []
+        if download_options["download_curr"]:
+            downloads.append(
+                ("CMEMS", download_currents, copernicus_path, "oce_files")
+            )
+        if download_options["download_wind"]:
+            downloads.append(
+                ("ERA5", download_winds, era5_path, "met_files")
+            )
+        for download in list(downloads):
+            if is_downloaded(download[3]):
+                logger.debug("Skipping %s download, files found", download[0])
+                downloads.remove(download)
+
+        def stage_files(output_path, folder):
+            # Rename into the experiment folder instead of copy + remove,
+            # files left by a previous run with the same name are replaced
+            destination = os.path.join(root_directory, folder)
+            simname = simulation["name"]
+            for file in _scan_files(output_path, ".nc"):
+                name = os.path.basename(file)
+                if identifier not in name or simname not in name:
+                    continue
+                target = os.path.join(destination, name)
+                try:
+                    os.replace(file, target)
+                except OSError:  # Cross-device, copy and remove
+                    shutil.move(file, target)
+            with open(manifest(folder), "w") as file:
+                json.dump(request, file)
+
+        # Currents and winds come from independent services, the
+        # network waits are overlapped by downloading them concurrently
+        # and each provider is staged as soon as its download finishes
+        with ThreadPoolExecutor(max_workers=len(downloads) or 1) as executor:
+            futures = {
+                executor.submit(download): (name, output_path, folder)
+                for name, download, output_path, folder in downloads
+            }
+            for future in as_completed(futures):
+                future.result()
+                name, output_path, folder = futures[future]
+                logger.info("%s download finished", name)
+                stage_files(output_path, folder)
 
+    @staticmethod
     def run_preproc(
         config: dict,
         exp_folder: str,
-        lon_min,
-        lon_max,
-        lat_min,
-        lat_max,
+        domain: tuple,
     ):
         """
-        Run preprocessing.
+        Run preprocessing, `domain` is (lon_min, lon_max, lat_min, lat_max).
         """
+        from WITOIL_iMagine.src.preprocessing import PreProcessing
 
-        domain = [lon_min, lon_max, lat_min, lat_max]
+        simulation = config["simulation"]
+        run_options = config["run_options"]
+        metoce = config["input_files"]["metoce"]
+        dtm = config["input_files"]["dtm"]
         preproc = PreProcessing(
-            config=config, exp_folder=exp_folder, domain=domain
+            config=config, exp_folder=exp_folder, domain=list(domain)
         )
         # Create folders
         preproc.create_directories()
@@ -243,15 +412,11 @@ class MedslikII:
                 config, domain, exp_folder
             )
 
-        if config["run_options"]["preprocessing"]:
+        if run_options["preprocessing"]:
 
-            if config["run_options"]["preprocessing_metoce"]:
-                oce_path = config["input_files"]["metoce"][
-                    "oce_data_path"
-                ]
-                met_path = config["input_files"]["metoce"][
-                    "met_data_path"
-                ]
+            if run_options["preprocessing_metoce"]:
+                oce_path = metoce["oce_data_path"]
+                met_path = metoce["met_data_path"]
                 if oce_path == "":
                     oce_path = None
                 if met_path == "":
@@ -265,42 +430,25 @@ class MedslikII:
                     met_path=f"{exp_folder}/met_files/"
                 )
 
-            if config["run_options"]["preprocessing_dtm"]:
+            if run_options["preprocessing_dtm"]:
                 # use the same grid on currents to crop bathymetry
                 preproc.common_grid()
                 # create Medslik-II bathymetry file inputs
-                preproc.process_bathymetry(
-                    config["input_files"]["dtm"]["bathymetry_path"]
-                )
+                preproc.process_bathymetry(dtm["bathymetry_path"])
                 # create Medslik-II coastline file inputs
-                preproc.process_coastline(
-                    config["input_files"]["dtm"]["coastline_path"]
-                )
+                preproc.process_coastline(dtm["coastline_path"])
 
-            spill_dictionary = {}
             logger.info("Writing single slick event")
-            spill_dictionary["simname"] = preproc.simname
-            spill_dictionary["dt_sim"] = config["simulation"][
-                "start_datetime"
-            ]
-            spill_dictionary["sim_length"] = int(
-                preproc.sim_length
-            )
-            spill_dictionary["longitude"] = config["simulation"][
-                "spill_lon"
-            ][0]
-            spill_dictionary["latitude"] = config["simulation"][
-                "spill_lat"
-            ][0]
-            spill_dictionary["spill_duration"] = int(
-                config["simulation"]["spill_duration"][0]
-            )
-            spill_dictionary["spill_rate"] = config["simulation"][
-                "spill_rate"
-            ][0]
-            spill_dictionary["oil_api"] = config["simulation"][
-                "oil"
-            ][0]
+            spill_dictionary = {
+                "simname": preproc.simname,
+                "dt_sim": simulation["start_datetime"],
+                "sim_length": int(preproc.sim_length),
+                "longitude": simulation["spill_lon"][0],
+                "latitude": simulation["spill_lat"][0],
+                "spill_duration": int(simulation["spill_duration"][0]),
+                "spill_rate": simulation["spill_rate"][0],
+                "oil_api": simulation["oil"][0],
+            }
             preproc.write_config_files(
                 spill_dictionary
             )
@@ -308,7 +456,7 @@ class MedslikII:
             logger.info("Modfying medslik_II.for")
             preproc.process_medslik_memmory_array()
             logger.info("Medslik-II simulation parameters")
-            if config["simulation"]["advanced_parameters"] == False:
+            if simulation["advanced_parameters"] == False:
                 logger.info("Using custom advanced parameters")
                 preproc.configuration_parameters()
             else:
@@ -319,119 +467,164 @@ class MedslikII:
         # model directory. Could be changed, but will remain fixed for the time being.
         model_dir = "WITOIL_iMagine/src/model/"
 
-        day = self.config["simulation"]["start_datetime"].day
-        year = self.config["simulation"]["start_datetime"].year
-        month = self.config["simulation"]["start_datetime"].month
-        hour = self.config["simulation"]["start_datetime"].hour
-        minute = self.config["simulation"]["start_datetime"].minute
-
-        output_dir = f"{model_dir}OUT/MDK_SIM_{year}_{month:02d}_{day:02d}_{hour:02d}{minute:02d}_{simname}/."
+        output_dir = (
+            f"{model_dir}OUT/MDK_SIM_{self.start_ts:%Y_%m_%d_%H%M}_{simname}/."
+        )
 
         # Remove old outputs (equivalent to `rm -rf`)
         if os.path.exists(output_dir):
             shutil.rmtree(output_dir)
 
-        oce_files = gg(f"{simdir}{simname}/oce_files/*.mrc")
-        met_files = gg(f"{simdir}{simname}/met_files/*.eri")
-        bnc_files = gg(f"{simdir}{simname}/bnc_files/*")
+        sim_dir = os.path.join(simdir, simname)
+        xp_dir = os.path.join(sim_dir, "xp_files")
+        run_dir = os.path.join(model_dir, "RUN")
+
+        # METOCEAN, MET and BNC inputs, grouped by destination
+        staging = {
+            os.path.join(run_dir, "TEMP", "OCE"): _scan_files(
+                os.path.join(sim_dir, "oce_files"), ".mrc"
+            ),
+            os.path.join(run_dir, "TEMP", "MET"): _scan_files(
+                os.path.join(sim_dir, "met_files"), ".eri"
+            ),
+            os.path.join(model_dir, "DTM_INP"): _scan_files(
+                os.path.join(sim_dir, "bnc_files")
+            ),
+        }
+        # Model source and configuration files, grouped by destination
         xp_files = {
-            "medslik_II.for": os.path.join(simdir, simname, "xp_files", "medslik_II.for"),
-            "config2.txt": os.path.join(simdir, simname, "xp_files", "config2.txt"),
-            "config1.txt": os.path.join(simdir, simname, "xp_files", "config1.txt"),
+            os.path.join(run_dir, "MODEL_SRC"): [
+                os.path.join(xp_dir, "medslik_II.for")
+            ],
+            run_dir: [
+                os.path.join(xp_dir, "config2.txt"),
+                os.path.join(xp_dir, "config1.txt"),
+            ],
         }
 
-        # Copy METOCEAN, MET, and BNC files
-        for file in oce_files:
-            shutil.copy(file, os.path.join(model_dir, "RUN", "TEMP", "OCE"))
-        for file in met_files:
-            shutil.copy(file, os.path.join(model_dir, "RUN", "TEMP", "MET"))
-        for file in bnc_files:
-            shutil.copy(file, os.path.join(model_dir, "DTM_INP"))
-
-        # Copy other required files
-        for dest, src in xp_files.items():
-            shutil.copy(src, os.path.join(model_dir, "RUN", dest if "config" in dest else "MODEL_SRC"))
+        # Copy the files the model scripts may edit, the compilation
+        # only needs these so it can start before the inputs are staged
+        for destination, files in xp_files.items():
+            for file in files:
+                shutil.copy(file, destination)
 
         # Compile and start running (replacing `cd` with `cwd`)
-        compile_script_path = os.path.abspath(os.path.join(model_dir, "RUN", "MODEL_SRC", "compile.sh"))
-        run_script_path = os.path.abspath(os.path.join(model_dir, "RUN", "RUN.sh"))
-        subprocess.run([compile_script_path], check=True, cwd=os.path.join(model_dir, "RUN")) # nosec
-        subprocess.run([run_script_path], check=True, cwd=os.path.join(model_dir, "RUN")) # nosec
+        compile_script_path = os.path.abspath(
+            os.path.join(run_dir, "MODEL_SRC", "compile.sh")
+        )
+        run_script_path = os.path.abspath(os.path.join(run_dir, "RUN.sh"))
+        compile_proc = subprocess.Popen(  # nosec
+            [compile_script_path], cwd=run_dir
+        )
+        try:
+            # Hard link the (large) input files while the model compiles,
+            # they are only read by the model, the per-file operations
+            # are overlapped in a thread pool
+            for destination in staging:
+                os.makedirs(destination, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [
+                    executor.submit(_stage, file, destination)
+                    for destination, files in staging.items()
+                    for file in files
+                ]
+                for future in futures:
+                    future.result()
+        except BaseException:
+            compile_proc.kill()
+            compile_proc.wait()
+            raise
+        if compile_proc.wait() != 0:
+            raise subprocess.CalledProcessError(
+                compile_proc.returncode, compile_proc.args
+            )
+        subprocess.run([run_script_path], check=True, cwd=run_dir)  # nosec
 
-        # Copy output files (replacing `cp -r`)
+        # Link output files, the temporary MET and OCE folders are not
+        # needed in the experiment so they are skipped instead of removed
         output_dest = os.path.join(simdir, simname, "out_files")
-        if os.path.exists(output_dir):
-            shutil.copytree(output_dir, output_dest, dirs_exist_ok=True)
-
-        # Remove temporary MET and OCE files (equivalent to `rm -rf`)
-        temp_met = os.path.join(output_dest, "MET")
-        temp_oce = os.path.join(output_dest, "OCE")
-        if os.path.exists(temp_met):
-            shutil.rmtree(temp_met)
-        if os.path.exists(temp_oce):
-            shutil.rmtree(temp_oce)
+        if os.path.isdir(output_dir):
+            _link_tree(output_dir, output_dest, exclude=("MET", "OCE"))
 
 
 def main_run(config_path=None):
-    # Logging first info
-    logger.info("Starting Medslik-II oil spill simulation")
-    exec_start_time = datetime.datetime.now()
-    logger.info(f"Execution starting time = {exec_start_time}")
-
-    logger.info("Defining the main object")
     config = Config(config_path).config_dict
 
-    main = MedslikII(config)
-
-    shutil.copy(
-        config_path, os.path.join(main.xp_directory, "config.toml")
-    )
-
-    # performing initial checking
-    main.initial_checking()
-
-    # Run preprocessing
-    logger.info("Starting pre processing ... ")
-    MedslikII.run_preproc(
-        main.config,
-        main.root_directory,
-        main.lon_min,
-        main.lon_max,
-        main.lat_min,
-        main.lat_max,
-    )
-    logger.info("End of pre processing ...")
-
-    # Run model
-    if main.config["run_options"]["run_model"]:
-        logger.info("Running Medslik-II simulation")
-        main.run_medslik_sim(
-            "WITOIL_iMagine/cases/",
-            main.config["simulation"]["name"],
+    # Nothing to run, avoid the checks done when building the main object
+    run_options = config["run_options"]
+    if not any(
+        (
+            config["download"].get("download_data"),
+            run_options.get("preprocessing"),
+            run_options.get("run_model"),
+            run_options.get("postprocessing"),
+            config.get("plot_options", {}).get("plotting"),
+        )
+    ):
+        logger.warning(
+            "All steps are disabled in %s, nothing to run", config_path
+        )
+        return
+
+    # The run log is started before the main object, so a failed check
+    # is also written to the log of the run it belongs to
+    out_directory = os.path.join(_experiment_directory(config), "out_files")
+    Path(out_directory).mkdir(parents=True, exist_ok=True)
+    with _run_log(out_directory):
+        # Logging first info
+        logger.info("Starting Medslik-II oil spill simulation")
+        exec_start_time = datetime.now()
+        logger.info("Execution starting time = %s", exec_start_time)
+
+        logger.info("Defining the main object")
+        main = MedslikII(config)
+        shutil.copy(
+            config_path, os.path.join(main.xp_directory, "config.toml")
         )
 
-    # performing postprocessing
-    if main.config["run_options"]["postprocessing"]:
-        PostProcessing.create_concentration_dataset(
-            lon_min=main.lon_min,
-            lon_max=main.lon_max,
-            lat_min=main.lat_min,
-            lat_max=main.lat_max,
-            filepath=main.out_directory,
+        # Run preprocessing
+        logger.info("Starting pre processing ... ")
+        MedslikII.run_preproc(
+            main.config,
+            main.root_directory,
+            main.domain,
         )
+        logger.info("End of pre processing ...")
+
+        # Run model
+        if main.config["run_options"]["run_model"]:
+            logger.info("Running Medslik-II simulation")
+            main.run_medslik_sim(
+                "WITOIL_iMagine/cases/",
+                main.config["simulation"]["name"],
+            )
+
+        # performing postprocessing
+        if main.config["run_options"]["postprocessing"]:
+            from WITOIL_iMagine.src.postprocessing import PostProcessing
+
+            PostProcessing.create_concentration_dataset(
+                lon_min=main.lon_min,
+                lon_max=main.lon_max,
+                lat_min=main.lat_min,
+                lat_max=main.lat_max,
+                filepath=main.out_directory,
+            )
+
+        # plotting the results
+        # if main.config["plot_options"]["plotting"]:
+        #     mplot = MedslikIIPlot(main)
+        #     mplot.plot_matplotlib(main.lon_min, main.lon_max, main.lat_min, main.lat_max)
+        #     mplot.plot_mass_balance()
 
-    # plotting the results
-    # if main.config["plot_options"]["plotting"]:
-    #     mplot = MedslikIIPlot(main)
-    #     mplot.plot_matplotlib(main.lon_min, main.lon_max, main.lat_min, main.lat_max)
-    #     mplot.plot_mass_balance()
+        if main.config["plot_options"]["plotting"]:
+            from WITOIL_iMagine.src.plot import MedslikIIPlot
 
-    if main.config["plot_options"]["plotting"]:
-        logger.info("Applying user-defined plot boundaries.")
+            logger.info("Applying user-defined plot boundaries.")
         
-        plot_lon = main.config["plot_options"].get("plot_lon", [main.lon_min, main.lon_max])
-        plot_lat = main.config["plot_options"].get("plot_lat", [main.lat_min, main.lat_max])
+            plot_lon = main.config["plot_options"].get("plot_lon", [main.lon_min, main.lon_max])
+            plot_lat = main.config["plot_options"].get("plot_lat", [main.lat_min, main.lat_max])
 
-        mplot = MedslikIIPlot(main)
-        mplot.plot_matplotlib(plot_lon[0], plot_lon[1], plot_lat[0], plot_lat[1])
-        mplot.plot_mass_balance()
+            mplot = MedslikIIPlot(main)
+            mplot.plot_matplotlib(plot_lon[0], plot_lon[1], plot_lat[0], plot_lat[1])
+            mplot.plot_mass_balance()
@@ -9,6 +9,7 @@ need to modify them for your needs.
 import io
 import logging
 import cv2
+import numpy as np
 from io import BytesIO
 
 # from fpdf import FPDF
@@ -21,6 +22,15 @@ logger = logging.getLogger(__name__)
 logger.setLevel(config.LOG_LEVEL)
 
 
+def _log_response(result, options):
+    """Logs the response type and option names at debug level. The result
+    and option values are not formatted, they can be large or secret.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response result type: %s", type(result).__name__)
+        logger.debug("Response options: %s", sorted(options))
+
+
 # EXAMPLE of json_response parser function
 # = HAVE TO MODIFY FOR YOUR NEEDS =
 def json_response(result, **options):
@@ -37,9 +47,7 @@ def json_response(result, **options):
     Returns:
         Converted result into json dictionary format.
     """
-    logger.debug("Response result type: %d", type(result))
-    logger.debug("Response result: %d", result)
-    logger.debug("Response options: %d", options)
+    _log_response(result, options)
     try:
         if isinstance(result, (dict, list, str)):
             return result
@@ -67,9 +75,7 @@ def json_response(result, **options):
 #     Returns:
 #         Converted result into pdf buffer format.
 #     """
-#     logger.debug("Response result type: %d", type(result))
-#     logger.debug("Response result: %d", result)
-#     logger.debug("Response options: %d", options)
+#     _log_response(result, options)
 #     try:
 #         # 1. create BytesIO object
 #         buffer = io.BytesIO()
@@ -84,8 +90,8 @@ def json_response(result, **options):
 #         # in this EXAMPLE we also add input parameters
 #         print_out = {"input": str(options), "predictions": str(result)}
 #         pdf.multi_cell(w=0, txt=str(print_out).replace(",", ",\n"))
-#         pdf_output = pdf.output(dest="S")
-#         buffer.write(pdf_output)
+#         # fPDF2 writes straight into the buffer, no intermediate bytes
+#         pdf.output(buffer)
 #         # 3. rewind buffer to the beginning
 #         buffer.seek(0)
 #         return buffer
@@ -95,20 +101,19 @@ def json_response(result, **options):
 
 
 def png_response(results, **options):
-    logger.debug("Response result type: %d", type(results))
-    logger.debug("Response result: %d", results)
-    logger.debug("Response options: %d", options)
-
-    check = 0
-    last_img = None
-    for file_name in glob.glob(results + "/surf*"):
-        fts = os.path.getmtime(file_name)
-        if fts > check:
-            check = fts
-            last_img = file_name
-    print(last_img)
+    _log_response(results, options)
+
+    images = glob.glob(results + "/surf*")
+    last_img = max(images, key=os.path.getmtime, default=None)
+    logger.debug("Latest surface image: %s", last_img)
 
     try:
+        # PNG plots are already encoded, send the file as it is instead
+        # of decoding and encoding it again
+        if last_img.lower().endswith(".png"):
+            with open(last_img, "rb") as image:
+                return BytesIO(image.read())
+
         # Passing path of image as parameter
         img = cv2.imread(last_img)
 
@@ -142,10 +147,14 @@ def create_video_in_buffer(frame_arrays, output_format="mp4"):
 
         out.release()
 
-    final_filename = "output.mp4"
-    os.rename(temp_filename, final_filename)
-    # Open the renamed file for reading
-    message = open(final_filename, "rb")
+    # Load the video in memory so no file handle is left open and
+    # concurrent requests do not share the same output file
+    try:
+        with open(temp_filename, "rb") as video:
+            message = BytesIO(video.read())
+    finally:
+        os.remove(temp_filename)
+    message.name = "output." + output_format
     return message
 
 
@@ -164,20 +173,20 @@ def mp4_response(results, **options):
         Converted result into mp4 buffer format.
     """
     # Process MP4 video response
-    logger.debug("Response result type: %d", type(results))
-    logger.debug("Response result: %d", results)
-    logger.debug("Response options: %d", options)
-    new_results = []
-    for result in results[0]:
-        # this will return a numpy array with the labels
-        new_results.append(
-            result.plot(
-                labels=options["show_labels"],
-                conf=options["show_conf"],
-                boxes=options["show_boxes"],
-            )
-        )
-    message = create_video_in_buffer(new_results)
+    _log_response(results, options)
+    plot_options = {
+        "labels": options["show_labels"],
+        "conf": options["show_conf"],
+        "boxes": options["show_boxes"],
+    }
+    # this will return a numpy array with the labels, the first frame
+    # gives the shape and dtype of the preallocated frame stack
+    first = results[0][0].plot(**plot_options)
+    frames = np.empty((len(results[0]),) + first.shape, dtype=first.dtype)
+    frames[0] = first
+    for i, result in enumerate(results[0][1:], start=1):
+        frames[i] = result.plot(**plot_options)
+    message = create_video_in_buffer(frames)
     return message
 
 
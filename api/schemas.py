@@ -7,11 +7,29 @@ The module shows simple but efficient example schemas. However, you may
 need to modify them for your needs.
 """
 
+import functools
+import re
+from datetime import datetime
+
 import marshmallow
 from webargs import ValidationError, fields, validate
 
 from . import config, responses, utils
 
+# Element field shared by the list arguments, marshmallow binds a copy of
+# the inner field to each list so one instance can be reused
+_FLOAT = fields.Float()
+# Validators are stateless, one instance is shared by the short lists
+_LENGTH_1_TO_5 = validate.Length(min=1, max=5)
+
+
+@functools.lru_cache(maxsize=128)
+def _full_path(base, name):
+    """Returns `name` joined to the `base` folder as a string, repeated
+    lookups for the same model or dataset reuse the first result.
+    """
+    return str(base / name)
+
 
 class ModelName(fields.String):
     """Field that takes a string and validates against current available
@@ -19,9 +37,9 @@ class ModelName(fields.String):
     """
 
     def _deserialize(self, value, attr, data, **kwargs):
-        if value not in utils.ls_dirs(config.MODELS_PATH):
+        if value not in utils.dir_names(config.MODELS_PATH):
             raise ValidationError(f"Checkpoint `{value}` not found.")
-        return str(config.MODELS_PATH / value)
+        return _full_path(config.MODELS_PATH, value)
 
 
 class Dataset(fields.String):
@@ -30,9 +48,28 @@ class Dataset(fields.String):
     """
 
     def _deserialize(self, value, attr, data, **kwargs):
-        if value not in utils.ls_dirs(config.DATA_PATH):
+        if value not in utils.dir_names(config.DATA_PATH):
             raise ValidationError(f"Dataset `{value}` not found.")
-        return str(config.DATA_PATH / value)
+        return _full_path(config.DATA_PATH, value)
+
+
+class IsoDateTime(fields.DateTime):
+    """Field that takes a datetime in the documented YYYY-MM-DDTHH:MM:SS
+    format and parses it with the C implemented datetime.fromisoformat,
+    other inputs are left to the default marshmallow DateTime field.
+    """
+
+    # Only the documented format takes the fast path, fromisoformat also
+    # accepts forms marshmallow rejects (dates alone, basic format)
+    FAST_FORMAT = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, str) and self.FAST_FORMAT.fullmatch(value):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+        return super()._deserialize(value, attr, data, **kwargs)
 
 
 # EXAMPLE of Prediction Args description
@@ -40,11 +77,6 @@ class Dataset(fields.String):
 class PredArgsSchema(marshmallow.Schema):
     """Prediction arguments schema for api.predict function."""
 
-    class Meta:  # Keep order of the parameters as they are defined.
-        # pylint: disable=missing-class-docstring
-        # pylint: disable=too-few-public-methods
-        ordered = True
-
     #    model_name = ModelName(
     #        metadata={
     #            "description": "String/Path identification for models.",
@@ -69,7 +101,7 @@ class PredArgsSchema(marshmallow.Schema):
         load_default="my_experiment",
     )
 
-    start_datetime = fields.DateTime(
+    start_datetime = IsoDateTime(
         metadata={
             "description": "Start date of the simulation in the format of YYYY-MM-DDTHH:MM:SS as this example 2021-08-21T03:43:00.",
         },
@@ -83,48 +115,48 @@ class PredArgsSchema(marshmallow.Schema):
     )
 
     spill_lat = fields.List(
-        cls_or_instance=fields.Float,
-        validate=validate.Length(min=1, max=5),
+        cls_or_instance=_FLOAT,
+        validate=_LENGTH_1_TO_5,
         metadata={
             "description": "List of latitudes of the oil spill (deg N).",
         },
-        load_default=[35.25],
+        load_default=(35.25,),
     )
 
     spill_lon = fields.List(
-        cls_or_instance=fields.Float,
-        validate=validate.Length(min=1, max=5),
+        cls_or_instance=_FLOAT,
+        validate=_LENGTH_1_TO_5,
         metadata={
             "description": "List of longitudes of the oil spill (deg E).",
         },
-        load_default=[35.90],
+        load_default=(35.90,),
     )
 
     spill_duration = fields.List(
-        cls_or_instance=fields.Float,
-        validate=validate.Length(min=1, max=5),
+        cls_or_instance=_FLOAT,
+        validate=_LENGTH_1_TO_5,
         metadata={
             "description": "List of durations of the oil spill in hours. 0.0 for instantaneous release.",
         },
-        load_default=[0.0],
+        load_default=(0.0,),
     )
 
     spill_rate = fields.List(
-        cls_or_instance=fields.Float,
-        validate=validate.Length(min=1, max=5),
+        cls_or_instance=_FLOAT,
+        validate=_LENGTH_1_TO_5,
         metadata={
             "description": "List of spill rates in tons per hour.",
         },
-        load_default=[27.78],
+        load_default=(27.78,),
     )
 
     oil = fields.List(
-        cls_or_instance=fields.Float,
-        validate=validate.Length(min=1, max=5),
+        cls_or_instance=_FLOAT,
+        validate=_LENGTH_1_TO_5,
         metadata={
             "description": "List of either API (number) of the oil or names (string). Names must be exact.",
         },
-        load_default=[28],
+        load_default=(28,),
     )
 
     copernicus_user = fields.String(
@@ -163,44 +195,44 @@ class PredArgsSchema(marshmallow.Schema):
     )
 
     lat = fields.List(
-        cls_or_instance=fields.Float,
+        cls_or_instance=_FLOAT,
         metadata={
             "description": "List of latitude values.",
         },
-        load_default=[31, 38],
+        load_default=(31, 38),
     )
 
     lon = fields.List(
-        cls_or_instance=fields.Float,
+        cls_or_instance=_FLOAT,
         metadata={
             "description": "List of longitude values.",
         },
-        load_default=[32, 37],
+        load_default=(32, 37),
     )
 
     delta = fields.List(
-        cls_or_instance=fields.Float,
-        validate=validate.Length(min=1, max=5),
+        cls_or_instance=_FLOAT,
+        validate=_LENGTH_1_TO_5,
         metadata={
             "description": "default domain length in degrees (applied to both lon/lat), to download or crop data. delta is used only if set_domain = false.",
         },
-        load_default=[0.75],
+        load_default=(0.75,),
     )
 
     plot_lat = fields.List(
-        cls_or_instance=fields.Float,
+        cls_or_instance=_FLOAT,
         metadata={
             "description": "Latitudinal boundaries for plotting.",
         },
-        load_default=[35, 36],
+        load_default=(35, 36),
     )
     
     plot_lon = fields.List(
-        cls_or_instance=fields.Float,
+        cls_or_instance=_FLOAT,
         metadata={
             "description": "Longitudinal boundaries for plotting.",
         },
-        load_default=[35.5, 36.5],
+        load_default=(35.5, 36.5),
     )
 
     accept = fields.String(
@@ -218,11 +250,6 @@ class PredArgsSchema(marshmallow.Schema):
 class TrainArgsSchema(marshmallow.Schema):
     """Training arguments schema for api.train function."""
 
-    class Meta:  # Keep order of the parameters as they are defined.
-        # pylint: disable=missing-class-docstring
-        # pylint: disable=too-few-public-methods
-        ordered = True
-
     model_name = ModelName(
         metadata={
             "description": "String/Path identification for models.",
@@ -7,7 +7,11 @@ The module shows simple but efficient example utilities. However, you may
 need to modify them for your needs.
 """
 
+import fnmatch
+import functools
 import logging
+import os
+import re
 import subprocess
 import sys
 from subprocess import TimeoutExpired
@@ -18,8 +22,28 @@ logger = logging.getLogger(__name__)
 logger.setLevel(config.LOG_LEVEL)
 
 
+# Last scan of each path for ls_dirs, as (modification time, names, set)
+_ls_dirs_cache = {}
+
+
+def _scan_dirs(path):
+    """Returns the cached scan of `path`, scanning again only when the
+    folder modification time changes (an entry was added, removed or
+    renamed).
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _ls_dirs_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        logger.debug("Scanning directories at: %s", path)
+        dirscan = tuple(sorted(x.name for x in path.iterdir() if x.is_dir()))
+        cached = _ls_dirs_cache[path] = (mtime, dirscan, frozenset(dirscan))
+    return cached
+
+
 def ls_dirs(path):
     """Utility to return a list of directories available in `path` folder.
+    The scan is cached and only repeated when the folder modification
+    time changes (an entry was added, removed or renamed).
 
     Arguments:
         path -- Directory path to scan for folders.
@@ -27,9 +51,33 @@ def ls_dirs(path):
     Returns:
         A list of strings for found subdirectories.
     """
-    logger.debug("Scanning directories at: %s", path)
-    dirscan = (x.name for x in path.iterdir() if x.is_dir())
-    return sorted(dirscan)
+    return list(_scan_dirs(path)[1])
+
+
+def dir_names(path):
+    """Utility to return the set of directories available in `path` folder,
+    for membership checks. Shares the cached scan of `ls_dirs`.
+
+    Arguments:
+        path -- Directory path to scan for folders.
+
+    Returns:
+        A frozenset of strings for found subdirectories.
+    """
+    return _scan_dirs(path)[2]
+
+
+@functools.lru_cache(maxsize=32)
+def compile_pattern(pattern):
+    """Utility to compile a file name pattern into a regular expression.
+
+    Arguments:
+        pattern -- File name pattern, see fnmatch.
+
+    Returns:
+        The compiled `re.Pattern`, cached for the following calls.
+    """
+    return re.compile(fnmatch.translate(pattern))
 
 
 def ls_files(path, pattern):
@@ -37,13 +85,20 @@ def ls_files(path, pattern):
 
     Arguments:
         path -- Directory path to scan.
-        pattern -- File pattern to filter found files. See glob.glob() python.
+        pattern -- File name pattern to filter found files, either a string
+          (see fnmatch) or a precompiled `re.Pattern`.
 
     Returns:
         A list of strings for files found according to the pattern.
     """
     logger.debug("Scanning for %s files at: %s", pattern, path)
-    dirscan = (x.name for x in path.glob(pattern))
+    if isinstance(pattern, str):
+        pattern = compile_pattern(pattern)
+    try:
+        with os.scandir(path) as entries:
+            dirscan = [x.name for x in entries if pattern.match(x.name)]
+    except FileNotFoundError:  # Missing folder, as Path.glob
+        return []
     return sorted(dirscan)
 
 
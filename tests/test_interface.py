@@ -0,0 +1,118 @@
+"""Testing module for the METOCE download step in api.interface. The
+WITOIL_iMagine modules are replaced by stubs, so no data is downloaded.
+"""
+
+# pylint: disable=redefined-outer-name
+import importlib
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def download():
+    """Fixture to return the stubbed WITOIL_iMagine download module."""
+    return types.SimpleNamespace(
+        download_copernicus=mock.Mock(),
+        get_era5=mock.Mock(),
+        process_era5=mock.Mock(),
+        write_cds=mock.Mock(),
+    )
+
+
+@pytest.fixture(scope="module")
+def interface(download):
+    """Fixture to import api.interface with WITOIL_iMagine stubbed."""
+    stubs = {
+        "WITOIL_iMagine": types.ModuleType("WITOIL_iMagine"),
+        "WITOIL_iMagine.src": types.ModuleType("WITOIL_iMagine.src"),
+        "WITOIL_iMagine.src.utils": types.SimpleNamespace(
+            Utils=mock.Mock(), Config=mock.Mock()
+        ),
+        "WITOIL_iMagine.src.download": download,
+    }
+    with mock.patch.dict(sys.modules, stubs):
+        sys.modules.pop("api.interface", None)
+        yield importlib.import_module("api.interface")
+        sys.modules.pop("api.interface", None)
+
+
+@pytest.fixture
+def config():
+    """Fixture to return the configuration of a currents download."""
+    return {
+        "download": {
+            "copernicus_user": "user",
+            "copernicus_password": "password",
+            "cds_token": "token",
+            "download_curr": True,
+            "download_wind": False,
+        },
+        "simulation": {
+            "start_datetime": "2021-08-21T03:43:00",
+            "sim_length": 24.0,
+            "name": "test",
+        },
+    }
+
+
+@pytest.fixture
+def root_directory(tmp_path, monkeypatch, download):
+    """Fixture to return an empty experiment folder."""
+    monkeypatch.chdir(tmp_path)
+    download.download_copernicus.reset_mock()
+    (tmp_path / "case" / "oce_files").mkdir(parents=True)
+    return tmp_path / "case"
+
+
+def run_download(interface, config, root_directory):
+    """Runs the download step over a fixed domain."""
+    domain = (35.0, 36.0, 34.0, 35.0)
+    interface.MedslikII.data_download_medslik(
+        config, domain, str(root_directory)
+    )
+
+
+def test_download(interface, config, root_directory, download):
+    """Tests the currents are downloaded into an empty experiment."""
+    run_download(interface, config, root_directory)
+    download.download_copernicus.assert_called_once()
+    assert (root_directory / ".oce_files.json").is_file()
+
+
+def test_download_skipped(interface, config, root_directory, download):
+    """Tests the download is skipped when the manifest matches and the
+    files are present.
+    """
+    run_download(interface, config, root_directory)
+    (root_directory / "oce_files" / "currents.nc").write_bytes(b"data")
+    run_download(interface, config, root_directory)
+    download.download_copernicus.assert_called_once()
+
+
+def test_download_no_manifest(interface, config, root_directory, download):
+    """Tests files without a manifest are downloaded again."""
+    (root_directory / "oce_files" / "currents.nc").write_bytes(b"data")
+    run_download(interface, config, root_directory)
+    download.download_copernicus.assert_called_once()
+
+
+def test_download_other_request(
+    interface, config, root_directory, download
+):
+    """Tests files from a different request are downloaded again."""
+    run_download(interface, config, root_directory)
+    (root_directory / "oce_files" / "currents.nc").write_bytes(b"data")
+    config["simulation"]["sim_length"] = 48.0
+    run_download(interface, config, root_directory)
+    assert download.download_copernicus.call_count == 2
+
+
+def test_download_empty_files(interface, config, root_directory, download):
+    """Tests empty files are downloaded again."""
+    run_download(interface, config, root_directory)
+    (root_directory / "oce_files" / "currents.nc").write_bytes(b"")
+    run_download(interface, config, root_directory)
+    assert download.download_copernicus.call_count == 2
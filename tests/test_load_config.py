@@ -0,0 +1,65 @@
+"""Testing module for the cached configuration loading in api."""
+
+# pylint: disable=redefined-outer-name
+import os
+
+import pytest
+
+import api
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Fixture to start and end each test with an empty config cache."""
+    api._config_cache.clear()  # pylint: disable=protected-access
+    yield
+    api._config_cache.clear()  # pylint: disable=protected-access
+
+
+def set_mtime(path, mtime):
+    """Sets the modification time of `path` in nanoseconds."""
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def toml_file(tmp_path):
+    """Fixture to return a toml configuration file."""
+    path = tmp_path / "config.toml"
+    path.write_text('[simulation]\nname = "first"\nspill_lat = [35.25]\n')
+    return path
+
+
+def test_load_config(toml_file):
+    """Tests the configuration file is parsed."""
+    config = api.load_config(toml_file)
+    assert config == {"simulation": {"name": "first", "spill_lat": [35.25]}}
+
+
+def test_load_config_copy(toml_file):
+    """Tests changes to a returned configuration do not reach the cache."""
+    config = api.load_config(toml_file)
+    config["simulation"]["name"] = "changed"
+    config["simulation"]["spill_lat"].append(36.0)
+    config = api.load_config(toml_file)
+    assert config["simulation"] == {"name": "first", "spill_lat": [35.25]}
+
+
+def test_load_config_modified(toml_file):
+    """Tests the configuration file is parsed again after a change."""
+    api.load_config(toml_file)
+    mtime = os.stat(toml_file).st_mtime_ns
+    toml_file.write_text('[simulation]\nname = "second"\n')
+    set_mtime(toml_file, mtime + 1_000_000_000)
+    assert api.load_config(toml_file) == {"simulation": {"name": "second"}}
+
+
+def test_load_config_same_mtime(tmp_path):
+    """Tests files with the same modification time are cached apart."""
+    first, second = tmp_path / "a.toml", tmp_path / "b.toml"
+    first.write_text("a = 1\n")
+    second.write_text("b = 2\n")
+    set_mtime(first, 1_700_000_000_000_000_000)
+    set_mtime(second, 1_700_000_000_000_000_000)
+    assert api.load_config(first) == {"a": 1}
+    assert api.load_config(second) == {"b": 2}
+    assert api.load_config(first) == {"a": 1}
@@ -0,0 +1,30 @@
+"""Testing module for the custom fields used by the API schemas."""
+
+# pylint: disable=redefined-outer-name
+from datetime import datetime
+
+import pytest
+from marshmallow import ValidationError
+
+from api import schemas
+
+
+@pytest.fixture(scope="module")
+def datetime_field():
+    """Fixture to return the field used for start_datetime."""
+    return schemas.PredArgsSchema().fields["start_datetime"]
+
+
+def test_datetime_documented_format(datetime_field):
+    """Tests the documented YYYY-MM-DDTHH:MM:SS format is parsed."""
+    value = datetime_field.deserialize("2021-08-21T03:43:00")
+    assert value == datetime(2021, 8, 21, 3, 43)
+
+
+@pytest.mark.parametrize(
+    "value", ["2021-08-21", "20210821T0343", "2021-13-21T03:43:00"]
+)
+def test_datetime_rejected_forms(datetime_field, value):
+    """Tests dates alone, basic format and invalid dates are rejected."""
+    with pytest.raises(ValidationError, match="Not a valid datetime."):
+        datetime_field.deserialize(value)
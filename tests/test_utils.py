@@ -0,0 +1,70 @@
+"""Testing module for the cached directory scans in api.utils."""
+
+# pylint: disable=redefined-outer-name
+import os
+
+import pytest
+
+from api import utils
+
+
+def touch_later(path):
+    """Moves the modification time of `path` forward, so the change is
+    seen even on filesystems with coarse timestamps.
+    """
+    mtime = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def folder(tmp_path):
+    """Fixture to return a folder with two subfolders and two files."""
+    (tmp_path / "model_a").mkdir()
+    (tmp_path / "model_b").mkdir()
+    (tmp_path / "surf_001.png").write_bytes(b"")
+    (tmp_path / "mass.csv").write_bytes(b"")
+    return tmp_path
+
+
+def test_ls_dirs(folder):
+    """Tests only the subfolders are listed, in order."""
+    assert utils.ls_dirs(folder) == ["model_a", "model_b"]
+    assert utils.dir_names(folder) == frozenset(["model_a", "model_b"])
+
+
+def test_ls_dirs_added(folder):
+    """Tests a subfolder added after a scan is listed."""
+    utils.ls_dirs(folder)
+    (folder / "model_c").mkdir()
+    touch_later(folder)
+    assert utils.ls_dirs(folder) == ["model_a", "model_b", "model_c"]
+    assert "model_c" in utils.dir_names(folder)
+
+
+def test_ls_dirs_removed(folder):
+    """Tests a subfolder removed after a scan is no longer listed."""
+    utils.dir_names(folder)
+    (folder / "model_a").rmdir()
+    touch_later(folder)
+    assert utils.ls_dirs(folder) == ["model_b"]
+    assert "model_a" not in utils.dir_names(folder)
+
+
+def test_ls_dirs_copy(folder):
+    """Tests changes to a returned list do not reach the cache."""
+    utils.ls_dirs(folder).append("model_x")
+    assert utils.ls_dirs(folder) == ["model_a", "model_b"]
+
+
+@pytest.mark.parametrize(
+    "pattern", ["surf*", utils.compile_pattern("surf*")]
+)
+def test_ls_files(folder, pattern):
+    """Tests string and precompiled patterns select the same files."""
+    assert utils.ls_files(folder, pattern) == ["surf_001.png"]
+
+
+def test_ls_files_missing(tmp_path):
+    """Tests a missing folder has no files."""
+    assert not utils.ls_files(tmp_path / "missing", "*")
+